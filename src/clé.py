@@ -7,43 +7,60 @@ Usage :
     python src/clé.py
     python src/clé.py --name mon_noeud
     python src/clé.py --output ./mes_cles/
+    python src/clé.py --name node --count 5
+    python src/clé.py --name node --count 1000 --jsonl
 """
 
 import os
 import json
 import hashlib
-import argparse
 from pathlib import Path
-from datetime import datetime
-import sys
-import tempfile
+from binascii import hexlify
+
+# argparse, sys, mmap, time et orjson sont importés là où ils
+# servent : importer ce module pour generate_pki_keys() reste léger.
+
+# Sélection de la bibliothèque une seule fois, au chargement du module
+try:
+    from nacl.bindings import crypto_sign_seed_keypair  # type: ignore[reportMissingImports]
+    HAVE_PYNACL = True
+except Exception:
+    HAVE_PYNACL = False
 
 
 def generate_keys_pynacl():
     """Génère avec PyNaCl (libsodium) — recommandé en production."""
-    # Imports optionnels — silence Pylance si non installés
-    import nacl.signing  # type: ignore[reportMissingImports]
-    import nacl.encoding  # type: ignore[reportMissingImports]
+    if not HAVE_PYNACL:
+        raise ImportError("PyNaCl n'est pas installé (pip install pynacl)")
+    # Appel direct à libsodium : même seed que bytes(SigningKey), sans objets intermédiaires
+    private_bytes = os.urandom(32)                                  # 32 bytes — seed privée
+    public_bytes, _ = crypto_sign_seed_keypair(private_bytes)      # 32 bytes — clé publique
 
-    # Génère la paire de clés Ed25519
-    signing_key = nacl.signing.SigningKey.generate()
-    verify_key  = signing_key.verify_key
+    return private_bytes, public_bytes
 
-    private_bytes = bytes(signing_key)           # 32 bytes — seed privée
-    public_bytes  = bytes(verify_key)            # 32 bytes — clé publique
 
-    return private_bytes, public_bytes
+def generate_keys_pynacl_batch(n: int):
+    """Génère n paires PyNaCl ; l'aléa des n seeds est tiré en un seul appel."""
+    if not HAVE_PYNACL:
+        raise ImportError("PyNaCl n'est pas installé (pip install pynacl)")
+    seeds = os.urandom(32 * n)
+    keys = []
+    for i in range(0, 32 * n, 32):
+        private_bytes = seeds[i:i + 32]
+        public_bytes, _ = crypto_sign_seed_keypair(private_bytes)
+        keys.append((private_bytes, public_bytes))
+    return keys
 
 
 def generate_keys_cryptography():
     """Génère avec la lib `cryptography` — alternative si PyNaCl absent."""
-    # Import optionnel — silence Pylance si non installé
+    # Import local : cryptography n'est chargée que si ce backend sert vraiment
     from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey  # type: ignore[reportMissingImports]
+    from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat, PrivateFormat, NoEncryption  # type: ignore[reportMissingImports]
 
     private_key   = Ed25519PrivateKey.generate()
     public_key    = private_key.public_key()
 
-    from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat, PrivateFormat, NoEncryption  # type: ignore[reportMissingImports]
     private_bytes = private_key.private_bytes(Encoding.Raw, PrivateFormat.Raw, NoEncryption())
     public_bytes  = public_key.public_bytes(Encoding.Raw, PublicFormat.Raw)
 
@@ -59,107 +76,317 @@ def generate_keys_fallback():
     return private_bytes, public_bytes
 
 
+def _pick_backend():
+    """Retourne (générateur, nom) selon les bibliothèques disponibles."""
+    if HAVE_PYNACL:
+        return generate_keys_pynacl, "PyNaCl (libsodium)"
+
+    # cryptography n'est importée que si PyNaCl est absent
+    try:
+        import cryptography.hazmat.primitives.asymmetric.ed25519  # type: ignore[reportMissingImports]
+    except Exception:
+        return generate_keys_fallback, "fallback (NON sécurisé)"
+    return generate_keys_cryptography, "cryptography (hazmat)"
+
+
+_GEN, _BACKEND_NAME = _pick_backend()
+
+
 def generate_pki_keys():
     """
-    Essaie les bibliothèques dans l'ordre de préférence.
+    Génère une paire de clés avec la bibliothèque choisie au chargement.
     Retourne (private_bytes, public_bytes, lib_used).
     """
-    # Essai 1 : PyNaCl (recommandé)
-    try:
-        private_bytes, public_bytes = generate_keys_pynacl()
-        return private_bytes, public_bytes, "PyNaCl (libsodium)"
-    except ImportError:
-        pass
-    except Exception as e:
-        print(f"  PyNaCl présent mais échec de génération : {e}")
+    private_bytes, public_bytes = _GEN()
+    return private_bytes, public_bytes, _BACKEND_NAME
 
-    # Essai 2 : cryptography
-    try:
-        private_bytes, public_bytes = generate_keys_cryptography()
-        return private_bytes, public_bytes, "cryptography (hazmat)"
-    except ImportError:
-        pass
-    except Exception as e:
-        print(f"  cryptography présent mais échec de génération : {e}")
 
-    # Fallback
-    private_bytes, public_bytes = generate_keys_fallback()
-    return private_bytes, public_bytes, "fallback (NON sécurisé)"
+def generate_pki_keys_batch(n: int):
+    """
+    Génère n paires de clés (provisionnement de plusieurs nœuds).
+    Retourne ([(private_bytes, public_bytes), ...], lib_used).
+    """
+    if _GEN is generate_keys_pynacl:
+        return generate_keys_pynacl_batch(n), _BACKEND_NAME
+    return [_GEN() for _ in range(n)], _BACKEND_NAME
+
+
+class HexBytesEncoder(json.JSONEncoder):
+    """Encode les bytes en hexadécimal pendant la sérialisation."""
+
+    def default(self, o):
+        if isinstance(o, (bytes, bytearray, memoryview)):
+            return hexlify(o).decode('ascii')
+        return super().default(o)
+
+
+def _fingerprint(public_bytes) -> str:
+    """Empreinte courte (16 hex) de la clé publique."""
+    # Identifiant d'affichage, pas un usage cryptographique
+    # 8 premiers octets du digest = 16 premiers caractères hex, sans tout encoder
+    digest = hashlib.sha256(public_bytes, usedforsecurity=False).digest()
+    return hexlify(digest[:8]).decode('ascii')
+
+
+def _hex_default(o):
+    """Hook `default` d'orjson : bytes → hexadécimal."""
+    if isinstance(o, (bytes, bytearray, memoryview)):
+        return hexlify(o).decode('ascii')
+    raise TypeError(f"Type non sérialisable : {type(o).__name__}")
+
 
+_ORJSON_UNSET = object()
+_orjson_module = _ORJSON_UNSET
 
-def save_keys(private_bytes, public_bytes, output_dir: str = ".archipel", name: str = "node"):
+
+def _orjson():
     """
-    Sauvegarde les clés sur disque.
+    Encodeur JSON optionnel (Rust) — cherché une seule fois, au premier usage.
+    Retourne le module orjson, ou None s'il est absent (repli sur json de la stdlib).
+    """
+    global _orjson_module
+    if _orjson_module is _ORJSON_UNSET:
+        try:
+            import orjson  # type: ignore[reportMissingImports]
+        except ImportError:
+            orjson = None
+        _orjson_module = orjson
+    return _orjson_module
+
+
+def _dumps(data: dict, pretty: bool = False) -> bytes:
+    """Sérialise en JSON UTF-8 — compact par défaut, indenté sur demande."""
+    # Le chemin compact par défaut (gabarits) n'appelle pas _dumps : orjson
+    # n'est donc chargé que pour --pretty
+    orjson = _orjson()
+    if orjson is not None:
+        # orjson écrit directement des bytes UTF-8
+        return orjson.dumps(data, default=_hex_default, option=orjson.OPT_INDENT_2 if pretty else 0)
+    fmt = {"indent": 2} if pretty else {"separators": (",", ":")}
+    return json.dumps(data, ensure_ascii=False, cls=HexBytesEncoder, **fmt).encode('utf-8')
+
+
+def _splice(payload: bytes, extra: bytes) -> bytes:
+    """
+    Fusionne deux objets JSON sérialisés (même format) sans repasser par un dict :
+    on retire la `}` finale du premier et la `{` initiale du second.
+    """
+    return payload.rstrip()[:-1].rstrip() + b"," + extra.lstrip()[1:]
 
-    Fichiers générés :
-    - identity.json       → clé privée (chmod 600, JAMAIS dans git)
-    - identity_public.json → clé publique (partageable)
+
+def _open_tmp(path: Path, mode: int):
     """
-    output = Path(output_dir)
-    output.mkdir(parents=True, exist_ok=True)
+    Crée `<path>.<pid>.<aléa>.tmp` avec ses permissions définitives dès la création
+    (pas de fenêtre avant un chmod). Retourne (tmp_path, fd).
+    """
+    # Suffixe aléatoire : un temporaire laissé par un run tué (même PID en
+    # conteneur) ne bloque pas les suivants via O_EXCL
+    tmp_path = f"{path}.{os.getpid()}.{os.urandom(4).hex()}.tmp"
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    return tmp_path, os.open(tmp_path, flags, mode)
+
 
-    # Validations basiques des octets de clé
-    if not isinstance(private_bytes, (bytes, bytearray)):
-        raise TypeError("private_bytes must be bytes")
-    if not isinstance(public_bytes, (bytes, bytearray)):
-        raise TypeError("public_bytes must be bytes")
-    if len(public_bytes) != 32:
-        raise ValueError(f"public_bytes must be 32 bytes (got {len(public_bytes)})")
-    if len(private_bytes) < 32:
-        raise ValueError(f"private_bytes must be at least 32 bytes (got {len(private_bytes)})")
-
-    node_id     = public_bytes.hex()
-    fingerprint = hashlib.sha256(public_bytes).hexdigest()[:16]
-    created_at  = datetime.now().isoformat()
-
-    # ── Fichier PUBLIC (partageable) ──────────────────────────────
+def _atomic_write(path: Path, payload: bytes, mode: int = 0o644):
+    """Écriture atomique : fichier temporaire dans le même dossier puis os.replace."""
+    tmp_path, fd = _open_tmp(path, mode)
+    try:
+        # write() sur le descripteur brut, sans objet fichier Python ; on boucle
+        # sur les écritures partielles pour ne jamais publier un fichier tronqué
+        try:
+            view = memoryview(payload)
+            while view:
+                written = os.write(fd, view)
+                if written == 0:
+                    raise OSError(f"écriture interrompue sur {tmp_path}")
+                view = view[written:]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except Exception:
+        import contextlib  # chemin d'erreur uniquement
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+def _now_iso() -> str:
+    """Horodatage local ISO 8601 à la seconde."""
+    import time
+    return time.strftime('%Y-%m-%dT%H:%M:%S')
+
+
+_WARNING = "NE JAMAIS partager ce fichier. NE JAMAIS le mettre dans git."
+
+# Schéma fixe : en mode compact, le JSON est produit par gabarit, sans dict ni
+# encodeur. Seuls node_name et created_at (fournis par l'appelant) sont échappés.
+_PUBLIC_TEMPLATE = (
+    '{{"node_name":{name},"node_id":"{nid}","public_key":"{pk}",'
+    '"fingerprint":"{fp}","algorithm":"Ed25519","created_at":{ts}}}'
+)
+# Le JSON privé = JSON public sans sa `}` finale + ces deux champs
+_SEED_PREFIX    = b',"private_key_seed":"'
+_WARNING_SUFFIX = b'","WARNING":' + json.dumps(_WARNING).encode('utf-8') + b'}'
+
+
+def _identity_payloads(private_bytes, public_bytes, name: str, created_at: str | None = None,
+                       pretty: bool = False):
+    """
+    Valide les clés et sérialise les enregistrements d'identité.
+    `created_at` (ISO 8601) permet de partager un seul horodatage pour tout un lot.
+    Retourne (public_payload, private_payload, fingerprint, node_id) — payloads en bytes.
+    """
+    # Validations basiques des octets de clé — memoryview lève TypeError
+    # pour tout objet qui n'expose pas de buffer, une seule branche pour les tailles
+    public_bytes  = memoryview(public_bytes).cast('B')
+    private_bytes = memoryview(private_bytes).cast('B')
+    if public_bytes.nbytes != 32 or private_bytes.nbytes < 32:
+        raise ValueError(
+            "public_bytes must be 32 bytes and private_bytes at least 32 bytes "
+            f"(got {public_bytes.nbytes} and {private_bytes.nbytes})"
+        )
+
+    node_id     = hexlify(public_bytes).decode('ascii')
+    fingerprint = _fingerprint(public_bytes)
+    created_at  = created_at or _now_iso()
+
+    if not pretty:
+        fields = {
+            "name": json.dumps(name, ensure_ascii=False),
+            "nid":  node_id,
+            "pk":   node_id,
+            "fp":   fingerprint,
+            "ts":   json.dumps(created_at, ensure_ascii=False),
+        }
+        public_payload  = _PUBLIC_TEMPLATE.format(**fields).encode('utf-8')
+        private_payload = public_payload[:-1] + _SEED_PREFIX + hexlify(private_bytes) + _WARNING_SUFFIX
+        return public_payload, private_payload, fingerprint, node_id
+
+    # ── Enregistrement PUBLIC (partageable) ───────────────────────
     public_data = {
         "node_name":   name,
         "node_id":     node_id,
-        "public_key":  public_bytes.hex(),
+        "public_key":  public_bytes,
         "fingerprint": fingerprint,
         "algorithm":   "Ed25519",
         "created_at":  created_at,
     }
 
-    public_path = output / "identity_public.json"
-    # Écriture atomique pour éviter les fichiers corrompus
+    # ── Enregistrement PRIVÉ (confidentiel) ───────────────────────
+    # Seuls les champs en plus sont sérialisés, puis greffés sur le JSON public
+    private_extra = {
+        "private_key_seed": private_bytes,
+        "WARNING": _WARNING,
+    }
+
+    public_payload = _dumps(public_data, pretty)
+    return public_payload, _splice(public_payload, _dumps(private_extra, pretty)), fingerprint, node_id
+
+
+def save_keys(private_bytes, public_bytes, output_dir: str = ".archipel", name: str = "node",
+              pretty: bool = False, created_at: str | None = None):
+    """
+    Sauvegarde les clés sur disque.
+
+    Fichiers générés :
+    - identity.json       → clé privée (chmod 600, JAMAIS dans git)
+    - identity_public.json → clé publique (partageable)
+
+    JSON compact par défaut ; `pretty=True` pour un fichier indenté.
+    """
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+
+    public_payload, private_payload, fingerprint, node_id = _identity_payloads(
+        private_bytes, public_bytes, name, created_at, pretty
+    )
+
+    public_path  = output / "identity_public.json"
+    private_path = output / "identity.json"
+
+    # Écritures atomiques séquentielles : pour ~300 octets, un pool de threads
+    # coûte plus cher que les deux écritures elles-mêmes
     try:
-        with tempfile.NamedTemporaryFile('w', delete=False, dir=str(output), encoding='utf-8') as tf:
-            json.dump(public_data, tf, indent=2, ensure_ascii=False)
-            tmp_public = Path(tf.name)
-        os.replace(tmp_public, public_path)
+        _atomic_write(public_path, public_payload)
     except Exception as e:
         raise RuntimeError(f"Impossible d'écrire la clé publique: {e}")
+    try:
+        _atomic_write(private_path, private_payload, 0o600)
+    except Exception as e:
+        raise RuntimeError(f"Impossible d'écrire la clé privée: {e}")
 
-    # ── Fichier PRIVÉ (confidentiel) ──────────────────────────────
-    private_data = {
-        **public_data,
-        "private_key_seed": private_bytes.hex(),
-        "WARNING": "NE JAMAIS partager ce fichier. NE JAMAIS le mettre dans git.",
-    }
+    return public_path, private_path, fingerprint, node_id
 
-    private_path = output / "identity.json"
+
+def save_keys_jsonl(keys, output_dir: str = ".archipel", name: str = "node"):
+    """
+    Sauvegarde un lot de clés dans deux fichiers JSON Lines (une ligne par nœud).
+
+    Fichiers générés :
+    - identities_private.jsonl → clés privées (chmod 600, JAMAIS dans git)
+    - identities_public.jsonl  → clés publiques (partageables)
+
+    Les nœuds sont nommés <name>1, <name>2, ...
+    Retourne (public_path, private_path, [(node_name, fingerprint, node_id), ...]).
+    """
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+
+    public_path  = output / "identities_public.jsonl"
+    private_path = output / "identities_private.jsonl"
+
+    summary = []
+    created_at = _now_iso()  # un seul horodatage pour tout le lot
+    # Deux fichiers séquentiels avec gros tampon : peu d'appels write() pour N nœuds
+    tmp_paths = []
     try:
-        with tempfile.NamedTemporaryFile('w', delete=False, dir=str(output), encoding='utf-8') as tf:
-            json.dump(private_data, tf, indent=2, ensure_ascii=False)
-            tmp_private = Path(tf.name)
+        # Chaque fd est confié à son `with` dès sa création : fermé même si
+        # l'ouverture du second échoue
+        tmp_public, fd_public = _open_tmp(public_path, 0o644)
+        tmp_paths.append(tmp_public)
+        with os.fdopen(fd_public, 'wb', buffering=1 << 20) as f_public:
+            tmp_private, fd_private = _open_tmp(private_path, 0o600)
+            tmp_paths.append(tmp_private)
+            with os.fdopen(fd_private, 'wb', buffering=1 << 20) as f_private:
+                for i, (private_bytes, public_bytes) in enumerate(keys, 1):
+                    node_name = f"{name}{i}"
+                    public_payload, private_payload, fingerprint, node_id = _identity_payloads(
+                        private_bytes, public_bytes, node_name, created_at
+                    )
+                    f_public.write(public_payload + b"\n")
+                    f_private.write(private_payload + b"\n")
+                    summary.append((node_name, fingerprint, node_id))
+        # Privé d'abord : un fichier public n'est jamais publié sans ses seeds
         os.replace(tmp_private, private_path)
+        os.replace(tmp_public, public_path)
     except Exception as e:
-        raise RuntimeError(f"Impossible d'écrire la clé privée: {e}")
+        # Ne jamais laisser traîner un temporaire (il peut contenir des seeds en clair)
+        for tmp_path in tmp_paths:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass  # déjà renommé ou jamais créé
+        raise RuntimeError(f"Impossible d'écrire les identités: {e}")
 
-    # Permissions restrictives (lecture seule propriétaire)
-    try:
-        # Tentative de restreindre les permissions (best-effort)
-        os.chmod(private_path, 0o600)
-    except Exception:
-        # Sur Windows, chmod est souvent inefficace; on continue sans échouer
-        pass
+    return public_path, private_path, summary
 
-    return public_path, private_path, fingerprint, node_id
+
+def _file_contains(path: Path, needles) -> bool:
+    """Cherche des motifs (bytes) dans un fichier ; mmap au-delà de 4 Kio."""
+    import mmap
+
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < 4096:
+            # Petit fichier : une lecture simple coûte moins que le mmap
+            content = f.read()
+            return any(n in content for n in needles)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return any(mm.find(n) >= 0 for n in needles)
 
 
 def main():
+    import argparse
+    import sys
+
     parser = argparse.ArgumentParser(
         description="Archipel — Générateur de clés PKI Ed25519"
     )
@@ -173,24 +400,77 @@ def main():
         default=".archipel",
         help="Dossier de sortie (défaut: .archipel/)"
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="JSON indenté (lisible) au lieu du format compact"
+    )
+    parser.add_argument(
+        "--count",
+        type=int,
+        default=1,
+        help="Nombre d'identités à générer (une par sous-dossier <name><i>/, "
+             "ou deux fichiers JSON Lines avec --jsonl)"
+    )
+    parser.add_argument(
+        "--jsonl",
+        action="store_true",
+        help="Avec --count N (N ≥ 2) : deux fichiers JSON Lines au lieu d'un dossier "
+             "par nœud ; incompatible avec --pretty"
+    )
     args = parser.parse_args()
+    if args.count < 1:
+        parser.error("--count doit être au moins 1")
+    if args.jsonl and args.count < 2:
+        parser.error("--jsonl nécessite --count 2 ou plus")
+    if args.jsonl and args.pretty:
+        parser.error("--pretty est incompatible avec --jsonl (une ligne par enregistrement)")
 
     print("\n╔══════════════════════════════════════════╗")
     print("║   Archipel — Génération de clés PKI   ║")
     print("╚══════════════════════════════════════════╝\n")
 
     try:
-        # Génération
-        print("  Génération de la paire de clés Ed25519...")
-        private_bytes, public_bytes, lib_used = generate_pki_keys()
-        print(f"  Bibliothèque utilisée : {lib_used}")
-
-        # Sauvegarde
-        public_path, private_path, fingerprint, node_id = save_keys(
-            private_bytes, public_bytes,
-            output_dir=args.output,
-            name=args.name,
-        )
+        if args.count > 1:
+            # Génération en lot — un sous-dossier par nœud
+            print(f"  Génération de {args.count} paires de clés Ed25519...")
+            keys, lib_used = generate_pki_keys_batch(args.count)
+            print(f"  Bibliothèque utilisée : {lib_used}")
+
+            if args.jsonl:
+                public_path, private_path, summary = save_keys_jsonl(
+                    keys, output_dir=args.output, name=args.name,
+                )
+                results = [
+                    (node_name, fingerprint, f"ligne {i}")
+                    for i, (node_name, fingerprint, _) in enumerate(summary, 1)
+                ]
+            else:
+                results = []
+                created_at = _now_iso()  # un seul horodatage pour tout le lot
+                for i, (private_bytes, public_bytes) in enumerate(keys, 1):
+                    node_name = f"{args.name}{i}"
+                    public_path, _, fingerprint, _ = save_keys(
+                        private_bytes, public_bytes,
+                        output_dir=os.path.join(args.output, node_name),
+                        name=node_name,
+                        pretty=args.pretty,
+                        created_at=created_at,
+                    )
+                    results.append((node_name, fingerprint, f"{public_path.parent}/"))
+        else:
+            # Génération
+            print("  Génération de la paire de clés Ed25519...")
+            private_bytes, public_bytes, lib_used = generate_pki_keys()
+            print(f"  Bibliothèque utilisée : {lib_used}")
+
+            # Sauvegarde
+            public_path, private_path, fingerprint, node_id = save_keys(
+                private_bytes, public_bytes,
+                output_dir=args.output,
+                name=args.name,
+                pretty=args.pretty,
+            )
     except KeyboardInterrupt:
         print("\nInterrompu par l'utilisateur.")
         sys.exit(2)
@@ -199,7 +479,19 @@ def main():
         sys.exit(1)
 
     # Affichage
-    print(f"""
+    if args.count > 1:
+        print(f"\n  {args.count} identités générées avec succès !\n")
+        for node_name, fingerprint, location in results:
+            print(f"  {node_name:<16} {fingerprint}  → {location}")
+        if args.jsonl:
+            print(f"\n  Clés publiques → {public_path}")
+            print(f"  Clés privées   → {private_path}  (chmod 600)")
+        print(f"""
+  Ne jamais partager les fichiers de clés privées
+  Ajouter {args.output}/ dans votre .gitignore
+""")
+    else:
+        print(f"""
   Clés générées avec succès !
 
   ┌─────────────────────────────────────────────┐
@@ -219,9 +511,8 @@ def main():
     # Vérifie que .gitignore protège bien le dossier
     gitignore = Path(".gitignore")
     if gitignore.exists():
-        content = gitignore.read_text()
-        out_entry = str(Path(args.output).as_posix()).rstrip('/')
-        if out_entry not in content and (out_entry + '/') not in content:
+        out_entry = Path(args.output).as_posix().rstrip('/')
+        if not _file_contains(gitignore, (out_entry.encode(), (out_entry + '/').encode())):
             print(f"   ATTENTION : {out_entry}/ n'est pas dans votre .gitignore !")
             print(f"      Ajoutez cette ligne : {out_entry}/\n")
         else: